@@ -1,14 +1,18 @@
 # app.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import time, hashlib
-from pathlib import Path
+from fastapi.responses import ORJSONResponse
+import time
+from functools import lru_cache
+from blake3 import blake3
 from routes.chat_routes import chat_router
 from routes.job_routes import job_router
+from services.llm_service import MODEL_PATH
 
-MODEL_PATH = Path(__file__).parent / "models" / "Llama-3.2-1B-Instruct-Q4_K_M.gguf"
-
-app = FastAPI(title="Self-Hosted AI + LinkedIn Job Scraper (RAW)")
+app = FastAPI(
+    title="Self-Hosted AI + LinkedIn Job Scraper (RAW)",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -24,10 +28,17 @@ app.include_router(job_router)
 def health():
     return {"status": "ok", "time": time.time()}
 
+@lru_cache(maxsize=1)
+def model_fingerprint():
+    # the model file doesn't change while the process runs: hash it once,
+    # mmap'd and with BLAKE3 spreading the work across all cores
+    hasher = blake3(max_threads=blake3.AUTO)
+    hasher.update_mmap(str(MODEL_PATH))
+    return MODEL_PATH.stat().st_size, hasher.hexdigest()
+
 @app.get("/model-info")
 def model_info():
-    size = MODEL_PATH.stat().st_size
-    sha = hashlib.sha256(MODEL_PATH.read_bytes()).hexdigest()
-    return {"model": str(MODEL_PATH), "size": size, "sha256": sha}
+    size, digest = model_fingerprint()
+    return {"model": str(MODEL_PATH), "size": size, "blake3": digest}
 
 
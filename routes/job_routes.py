@@ -1,14 +1,18 @@
 # routes/job_routes.py
 
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter
 from pydantic import BaseModel
 from services.scrape_service import fetch_linkedin_jobs
-from services.match_service import job_matches_skills
+from services.match_service import job_matches_skills, build_skill_matcher
 from services.scrape_service import fetch_job_details
 from services.llm_service import summarize_job
 
 job_router = APIRouter(prefix="/jobs")
 
+# Max concurrent job detail fetches per search
+DETAIL_WORKERS = 8
+
 class UserSearch(BaseModel):
     job_wanted: str
     skills: list[str]
@@ -23,12 +27,19 @@ def search_user(req: UserSearch):
     if raw["error"]:
         return raw
 
+    matcher = build_skill_matcher(req.skills)
+
+    # fetch all job details concurrently; matching stays in this thread
+    details_list = []
+    if raw["jobs"]:
+        with ThreadPoolExecutor(max_workers=min(len(raw["jobs"]), DETAIL_WORKERS)) as pool:
+            details_list = list(pool.map(fetch_job_details, [job["url"] for job in raw["jobs"]]))
+
     filtered = []
-    for job in raw["jobs"]:
-        details = fetch_job_details(job["url"])
+    for job, details in zip(raw["jobs"], details_list):
         full_desc = details.get("description", "") or ""
 
-        if job_matches_skills(full_desc, req.skills):
+        if job_matches_skills(full_desc, matcher, len(req.skills)):
             job["ai_summary"] = summarize_job(full_desc, req.skills) + f"\n\nJob URL: {job['url']}"
             filtered.append(job)
 
@@ -1,23 +1,71 @@
 # services/llm_service.py
 import os
+import platform
+import threading
+from functools import lru_cache
 from pathlib import Path
 from llama_cpp import Llama
 
-MODEL_PATH = Path(__file__).parent.parent / "models" / "Llama-3.2-1B-Instruct-Q4_K_M.gguf"
+MODEL_DIR = Path(__file__).parent.parent / "models"
 
-llm = Llama(
-    model_path=str(MODEL_PATH),
-    n_ctx=1024,
-    n_threads=os.cpu_count() or 4,
-    verbose=False,
+# 4-bit weights halve the bytes streamed per decoded token compared to f16.
+# On ARM, prefer the Q4_0_8_8 repack so llama.cpp uses its MMLA kernels.
+MODEL_PATH = MODEL_DIR / "Llama-3.2-1B-Instruct-Q4_K_M.gguf"
+
+if platform.machine().lower() in ("aarch64", "arm64"):
+    arm_model = MODEL_DIR / "Llama-3.2-1B-Instruct-Q4_0_8_8.gguf"
+    if arm_model.exists():
+        MODEL_PATH = arm_model
+
+SUMMARY_MAX_TOKENS = 200
+
+# Fixed instructions that open every summarize_job prompt
+SUMMARY_HEADER = (
+    "Summarize the following job posting one paragraph.\n"
+    "RULES:\n"
+    "- DO NOT make up or guess any technologies.\n"
+    "- ONLY use information that appears in the text.\n"
+    "- If a section is missing, write 'Not specified'.\n"
+    "- Relate the users skills with the job posting if possible.\n"
 )
 
-def chat_completion(messages: list):
-    return llm.create_chat_completion(
-        messages=messages,
-        max_tokens=256,
-        temperature=0.0,
+# tokens reserved for the chat template wrapped around the prompt
+CONTEXT_SAFETY = 64
+
+# Llama is not thread-safe and sync routes run in FastAPI's threadpool,
+# so loading and generation are serialized behind one lock.
+LLM_LOCK = threading.Lock()
+
+@lru_cache(maxsize=1)
+def get_llm():
+    """
+    Loads the model once per process on first use.
+    Run uvicorn with --workers 1 so the weights are resident only once.
+    """
+    llm = Llama(
+        model_path=str(MODEL_PATH),
+        # fits a 3000-char description + prompt + summary, keeps the KV cache small
+        n_ctx=2048,
+        n_batch=2048,
+        n_ubatch=512,
+        n_threads=os.cpu_count() or 4,
+        n_threads_batch=os.cpu_count() or 4,
+        # keep weights resident (needs a high enough RLIMIT_MEMLOCK,
+        # e.g. --ulimit memlock=-1) so decode never re-faults pages
+        use_mmap=True,
+        use_mlock=True,
+        offload_kqv=True,
+        verbose=False,
     )
+    return llm
+
+def chat_completion(messages: list):
+    with LLM_LOCK:
+        return get_llm().create_chat_completion(
+            messages=messages,
+            max_tokens=256,
+            temperature=0.0,
+        )
 
 def summarize_job(description: str, skills: list[str]):
     if not description:
@@ -27,45 +75,34 @@ def summarize_job(description: str, skills: list[str]):
 
     skill_list = ", ".join(skills)
 
-    # progressively smaller text chunks
-    limits = [2500, 1800, 1200, 800, 500]
-
-    for limit in limits:
-        try:
-            desc_chunk = description[:limit]
+    # static rules first: Llama skips re-evaluating the tokens this prompt
+    # shares with the previous one, so consecutive summaries reuse the prefix
+    header = f"{SUMMARY_HEADER}User skills: {skill_list}\n\nJob Description:\n"
 
-            prompt = (
-               "Summarize the following job posting one paragraph.\n"
-               "RULES:\n"
-               "- DO NOT make up or guess any technologies.\n"
-               "- ONLY use information that appears in the text.\n"
-               "- If a section is missing, write 'Not specified'.\n"
-               "- Relate the users skills with the job posting if possible.\n"
-               "User skills: {skills}\n\n"
-              "Job Description:\n{desc}"
-              ).format(
-                  skills=", ".join(skills),
-                  desc=description
-              )
+    try:
+        with LLM_LOCK:
+            llm = get_llm()
 
+            # truncate the description to exactly what fits in the context
+            header_tokens = llm.tokenize(header.encode("utf-8"), add_bos=False)
+            budget = llm.n_ctx() - len(header_tokens) - SUMMARY_MAX_TOKENS - CONTEXT_SAFETY
+            desc_tokens = llm.tokenize(description.encode("utf-8"), add_bos=False)
+            desc_chunk = llm.detokenize(desc_tokens[:max(budget, 0)]).decode("utf-8", errors="ignore")
 
             resp = llm.create_chat_completion(
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
+                messages=[{"role": "user", "content": header + desc_chunk}],
+                max_tokens=SUMMARY_MAX_TOKENS,
                 temperature=0.3,
             )
 
-            choice = resp["choices"][0]
-            return (
-                choice.get("message", {}).get("content")
-                or choice.get("text")
-                or "AI summary unavailable."
-            )
-
-        except Exception as e:
-            print(f"[summarize_job] Failed with limit={limit}: {e}")
-            continue
-
-    return "AI summary could not be generated due to context window limits."
+        choice = resp["choices"][0]
+        return (
+            choice.get("message", {}).get("content")
+            or choice.get("text")
+            or "AI summary unavailable."
+        )
 
+    except Exception as e:
+        print(f"[summarize_job] Failed: {e}")
 
+    return "AI summary could not be generated."
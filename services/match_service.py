@@ -1,5 +1,12 @@
 # services/match_service.py
 import re
+from collections import Counter
+import ahocorasick
+
+TOKEN_RE = re.compile(r"[A-Za-z0-9\+\#]+")
+
+# characters that can continue a token (in lowercased text)
+TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#")
 
 def tokenize(text: str):
     """
@@ -12,39 +19,81 @@ def tokenize(text: str):
     - go
     are matched properly without false positives.
     """
-    return re.findall(r"[A-Za-z0-9\+\#]+", text.lower())
+    return TOKEN_RE.findall(text.lower())
 
-def job_matches_skills(description: str, skills: list[str], threshold: float = 0.25):
+def build_skill_matcher(skills: list[str]):
+    """
+    Builds an Aho-Corasick automaton over the user's skills, once per
+    request, so each job description is scanned in a single pass.
+    Skills that can't be a single token (e.g. 'machine learning') are
+    left out, as exact token matching could never match them.
+    Returns (skill word, times listed) pairs alongside the automaton,
+    so a skill listed twice (e.g. 'Java' and 'java') counts twice.
+    """
+    counts = Counter(
+        skill.lower().strip() for skill in skills
+        if TOKEN_RE.fullmatch(skill.lower().strip())
+    )
+
+    automaton = ahocorasick.Automaton()
+    for word, count in counts.items():
+        automaton.add_word(word, (word, count))
+
+    if counts:
+        automaton.make_automaton()
+    return tuple(counts.items()), automaton
+
+def job_matches_skills(description: str, matcher, skill_count: int, threshold: float = 0.25):
     """
     Matches user skills to job description using exact token matching.
 
+    matcher comes from build_skill_matcher(); skill_count is the number
+    of skills the user gave, which the match ratio is measured against.
+    Each listed skill counts, duplicates included.
+
     Example:
     - 'java' will NOT match 'javascript'
     - 'rust' will NOT match 'trusted'
     - 'go' will NOT match 'google'
     - 'c' will NOT match 'react'
 
-    Matching is reliable and avoids substring false positives.
+    Matching is reliable and avoids substring false positives: a hit
+    only counts when it isn't surrounded by other token characters.
+    The scan stops as soon as enough skills have matched to reach the
+    threshold.
     """
 
     if not description:
         return False
 
-    # Tokenize the job description once
-    tokens = tokenize(description)
-    token_set = set(tokens)
+    words, automaton = matcher
+    matched = set()
+    hits = 0
 
-    matched = 0
+    if words:
+        text = description.lower()
+        last = len(text) - 1
 
-    for skill in skills:
-        skill_clean = skill.lower().strip()
-        if not skill_clean:
-            continue
+        # Cheap substring pre-filter: a skill missing as a substring can't
+        # match as a token, so most non-matching jobs stop here
+        present = sum(count for word, count in words if word in text)
+        if present / skill_count < threshold:
+            return False
 
-        # Token-based exact comparison
-        if skill_clean in token_set:
-            matched += 1
+        for end, (skill, count) in automaton.iter(text):
+            start = end - len(skill) + 1
 
-    ratio = matched / len(skills) if skills else 0
-    return ratio >= threshold
+            # Word-boundary guard: the hit must be a whole token
+            if start > 0 and text[start - 1] in TOKEN_CHARS:
+                continue
+            if end < last and text[end + 1] in TOKEN_CHARS:
+                continue
 
+            if skill not in matched:
+                matched.add(skill)
+                hits += count
+                if hits / skill_count >= threshold:
+                    return True
+
+    ratio = hits / skill_count if skill_count else 0
+    return ratio >= threshold
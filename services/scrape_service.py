@@ -1,39 +1,465 @@
 # services/scrape_service.py
 
+import os
+import re
+import copy
 import time
+import threading
 import logging
+import orjson
+from html import unescape
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
+from diskcache import Cache
 from urllib.parse import quote_plus
 
 # Cache time-to-live (in seconds)
 CACHE_TTL = 60
 
-# In-memory caches
-JOB_CACHE = {}
-SUMMARY_CACHE = {}
-DETAIL_CACHE = {}
+# Max concurrent per-card summary fetches
+SUMMARY_WORKERS = 8
+
+# Browser-like request headers, sent with every LinkedIn request
+HEADERS = MappingProxyType({
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-CA,en-US;q=0.9",
+    # every encoding urllib3 can decode here: gzip, deflate, and br when
+    # brotli is installed
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+})
+
+# Longest Retry-After wait honoured (in seconds); retries sleep inside the
+# request handler, so a longer ask just returns the 429 instead
+RETRY_AFTER_MAX = 5
+
+
+class CappedRetry(Retry):
+    """
+    Retry that clamps a server's Retry-After to RETRY_AFTER_MAX, so one
+    429 can't park a request thread (and everyone coalesced onto it)
+    for hours.
+    """
+
+    def parse_retry_after(self, retry_after):
+        return min(super().parse_retry_after(retry_after), RETRY_AFTER_MAX)
+
+
+# Shared HTTP session: keeps TLS connections to linkedin.com alive
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=SUMMARY_WORKERS * 4,
+    # exponential backoff on transient failures, honouring LinkedIn's
+    # Retry-After on 429 (capped); the last response is returned, not raised
+    max_retries=CappedRetry(
+        total=4,
+        backoff_factor=0.8,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+))
+SESSION.headers.update(HEADERS)
+
+# How long job details are kept past CACHE_TTL for conditional re-fetches
+VALIDATOR_TTL = 24 * 60 * 60
+
+# On-disk cache directory, shared by every worker process of this app.
+# Cached values are pickled, so it must not be writable by other users:
+# it lives in the project (or TEAMV5_CACHE_DIR) and is created owner-only.
+CACHE_DIR = Path(
+    os.environ.get("TEAMV5_CACHE_DIR")
+    or Path(__file__).parent.parent / ".cache" / "scrape"
+)
+CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+# Scrape cache (SQLite + mmap, thread- and process-safe, bounded to 1 GiB);
+# keys are prefixed "linkedin|", "summary|" or "detail|"
+CACHE = Cache(str(CACHE_DIR), size_limit=2**30)
+
+# Percent-encoding for search terms; users repeat the same few queries
+quote_query = lru_cache(maxsize=1024)(quote_plus)
+
+# Cache-miss sentinel (a cached summary can legitimately be None)
+MISSING = object()
+
+# Outbound fetches in progress, by cache key; see single_flight()
+INFLIGHT = {}
+INFLIGHT_LOCK = threading.Lock()
+
+# Job description selectors, most common LinkedIn markup first
+DESCRIPTION_SELECTORS = (
+    ".show-more-less-html__markup",
+    ".description__text",
+    "div[data-test-job-description-text]",
+    ".job-details",
+    "#job-details",
+    ".decorated-job-posting__details",
+    ".core-section-container",
+    'section[class*="description"]',
+)
+
+# Job detail page top-card selectors, in fallback order
+DETAIL_TITLE_SELECTORS = ("h1", ".topcard__title")
+DETAIL_COMPANY_SELECTORS = (".topcard__org-name-link", ".topcard__flavor")
+DETAIL_LOCATION_SELECTORS = (".topcard__flavor--bullet", ".sub-nav-cta__meta-text")
+
+# JSON-LD block embedded in job detail pages (schema.org JobPosting)
+LD_JSON_RE = re.compile(
+    rb'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>',
+    re.DOTALL,
+)
+
+# charset parameter of a Content-Type header
+CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# Any job card link; a search page without one has no cards to parse
+CARD_MARKER_RE = re.compile(rb"base-card__full-link|result-card__full-card-link|/jobs/view/")
+
+# LinkedIn's rate-limit / auth challenge page links to its checkpoint flow
+CHALLENGE_MARKER = b"checkpoint/challenge"
+
+# Card field rules as (tag, class, href substring), in fallback order;
+# None matches anything. Mirrors e.g. "a.base-card__full-link", "h3".
+CARD_FIELD_RULES = (
+    ("anchor", (
+        ("a", "base-card__full-link", None),
+        ("a", "result-card__full-card-link", None),
+        ("a", None, "/jobs/view/"),
+    )),
+    ("title", (
+        ("h3", None, None),
+        (None, "base-search-card__title", None),
+        (None, "job-card-list__title", None),
+    )),
+    ("company", (
+        ("h4", None, None),
+        (None, "base-search-card__subtitle", None),
+        (None, "job-card-container__company-name", None),
+        (None, "job-card-list__company-name", None),
+    )),
+    ("location", (
+        (None, "job-search-card__location", None),
+        (None, "job-card-container__metadata-item", None),
+    )),
+)
+
+# ------------------------------
+# Helper: coalesce concurrent fetches
+# ------------------------------
+
+def single_flight(key, fn, *args):
+    """
+    Runs fn(*args) once per key at a time. Callers that arrive while
+    it is running wait for the same result or exception. Each caller
+    gets its own deep copy of the result, since callers mutate it
+    (e.g. search_user adds "ai_summary" to each job).
+    """
+
+    with INFLIGHT_LOCK:
+        fut = INFLIGHT.get(key)
+        leader = fut is None
+        if leader:
+            fut = INFLIGHT[key] = Future()
+
+    if not leader:
+        return copy.deepcopy(fut.result())
+
+    try:
+        fut.set_result(fn(*args))
+    except BaseException as e:
+        fut.set_exception(e)
+    finally:
+        with INFLIGHT_LOCK:
+            del INFLIGHT[key]
+    return copy.deepcopy(fut.result())
+
+
+# ------------------------------
+# Helper: index card field rules
+# ------------------------------
+
+def index_card_rules(field_rules):
+    """
+    Turns (field, rules) pairs into dispatch tables keyed by class name
+    and by tag, so each element only checks the few rules that could
+    match it. Entries are (field, rank, tag, href substring).
+    """
+
+    by_class, by_tag = {}, {}
+    for field, rules in field_rules:
+        for rank, (tag, cls, href_part) in enumerate(rules):
+            if cls:
+                by_class.setdefault(cls, []).append((field, rank, tag, href_part))
+            else:
+                by_tag.setdefault(tag, []).append((field, rank, tag, href_part))
+    return by_class, by_tag
+
+
+CARD_RULE_INDEX = index_card_rules(CARD_FIELD_RULES)
+
+# ------------------------------
+# Helper: stream job cards
+# ------------------------------
+
+class CardCollector:
+    """
+    lxml parser target that streams a search results page and keeps
+    only each job card's fields, so no document tree is ever built.
+    Cards are <li> elements, or div.base-card when there are no <li>s.
+    For each field the element matching the earliest fallback rule in
+    CARD_FIELD_RULES wins, first in document order.
+    """
+
+    def __init__(self, rule_index=CARD_RULE_INDEX):
+        self.by_class, self.by_tag = rule_index
+        self.items = []
+        self.base_cards = []
+        self.open_cards = []
+        # per open element: (card it opens or None, text buffers it opened)
+        self.stack = []
+        # text buffers of the field elements currently open
+        self.active = []
+        self.pending_text = []
+
+    def flush_text(self):
+        text = "".join(self.pending_text).strip()
+        self.pending_text = []
+        if text:
+            for parts in self.active:
+                parts.append(text)
+
+    def start(self, tag, attrib):
+        self.flush_text()
+        classes = (attrib.get("class") or "").split()
+        href = attrib.get("href")
+        buffers = []
+
+        # Candidate rules for this element, looked up by tag and class
+        rules = self.by_tag.get(tag, [])
+        for cls in classes:
+            if cls in self.by_class:
+                rules = rules + self.by_class[cls]
+        if len(rules) > 1:
+            rules = sorted(rules, key=lambda rule: rule[1])
+
+        for card in self.open_cards:
+            for field, rank, rule_tag, href_part in rules:
+                if rule_tag and tag != rule_tag:
+                    continue
+                if href_part and href_part not in (href or ""):
+                    continue
+                found = card.get(field)
+                if found and rank >= found["rank"]:
+                    continue
+                parts = []
+                card[field] = {"rank": rank, "parts": parts, "href": href}
+                buffers.append(parts)
+
+        card = None
+        if tag == "li" or (tag == "div" and "base-card" in classes):
+            card = {}
+            (self.items if tag == "li" else self.base_cards).append(card)
+            self.open_cards.append(card)
+
+        self.active.extend(buffers)
+        self.stack.append((card, buffers))
+
+    def data(self, data):
+        self.pending_text.append(data)
+
+    def end(self, tag):
+        self.flush_text()
+        if not self.stack:
+            return
+
+        card, buffers = self.stack.pop()
+        if card is not None:
+            self.open_cards.pop()
+        if buffers:
+            del self.active[-len(buffers):]
+
+    def close(self):
+        self.flush_text()
+        return [
+            {
+                field: {"text": " ".join(found["parts"]), "href": found["href"]}
+                for field, found in card.items()
+            }
+            for card in (self.items or self.base_cards)
+        ]
+
+
+def parse_cards(html: bytes, encoding: str = "utf-8"):
+    """
+    Streams search results HTML through a CardCollector and returns
+    one dict of {field: {"text", "href"}} per job card.
+    """
+
+    if not html.strip():
+        return []
+
+    try:
+        parser = etree.HTMLParser(target=CardCollector(), encoding=encoding)
+    except LookupError:
+        parser = etree.HTMLParser(target=CardCollector(), encoding="utf-8")
+    parser.feed(html)
+    return parser.close()
+
+
+# ------------------------------
+# Helper: decode responses once
+# ------------------------------
+
+def html_encoding(resp):
+    """
+    Returns the charset declared in the Content-Type header, or UTF-8
+    (what LinkedIn serves). The body is never sniffed for an encoding.
+    """
+
+    match = CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    return match.group(1).lower() if match else "utf-8"
+
+
+def parse_html(resp):
+    """
+    Parses a response body with selectolax. UTF-8 bytes go straight
+    to lexbor; other declared charsets are decoded exactly once.
+    """
+
+    encoding = html_encoding(resp)
+    if encoding not in ("utf-8", "utf8"):
+        try:
+            return LexborHTMLParser(resp.content.decode(encoding, errors="replace"))
+        except LookupError:
+            pass
+    return LexborHTMLParser(resp.content)
+
+
+# ------------------------------
+# Helper: first matching selector
+# ------------------------------
+
+def first_match(tree, selectors):
+    """
+    Returns the first element matched by the selectors, trying each
+    selector in order and stopping at the first hit.
+    """
+
+    for sel in selectors:
+        el = tree.css_first(sel)
+        if el:
+            return el
+    return None
+
 
 # ------------------------------
 # Helper: resolve job description elements
 # ------------------------------
 
-def extract_description_element(soup):
+def extract_description_element(tree):
     """
     LinkedIn frequently changes class names. This function tries
     multiple possible selectors to extract job descriptions.
     """
 
-    return (
-        soup.select_one(".show-more-less-html__markup") or
-        soup.select_one(".description__text") or
-        soup.select_one("div[data-test-job-description-text]") or
-        soup.select_one(".job-details") or
-        soup.select_one("#job-details") or
-        soup.select_one(".decorated-job-posting__details") or
-        soup.select_one(".core-section-container") or
-        soup.find("section", {"class": lambda x: x and "description" in x})
-    )
+    return first_match(tree, DESCRIPTION_SELECTORS)
+
+
+# ------------------------------
+# Helper: read JSON-LD job posting
+# ------------------------------
+
+def parse_job_posting_ld(content: bytes):
+    """
+    Reads title, company, location and description from the page's
+    JSON-LD JobPosting. Returns None when it's missing or malformed,
+    so callers can fall back to the HTML selectors.
+    """
+
+    for match in LD_JSON_RE.finditer(content):
+        try:
+            data = orjson.loads(match.group(1))
+        except orjson.JSONDecodeError:
+            continue
+
+        if isinstance(data, dict):
+            postings = data.get("@graph", [data])
+        else:
+            postings = data if isinstance(data, list) else []
+
+        for posting in postings:
+            if not isinstance(posting, dict) or posting.get("@type") != "JobPosting":
+                continue
+
+            title = posting.get("title")
+            description = posting.get("description")
+            if not (isinstance(title, str) and isinstance(description, str)):
+                continue
+
+            # description is (often entity-escaped) HTML
+            desc_tree = LexborHTMLParser(unescape(description))
+
+            org = posting.get("hiringOrganization")
+            company = org.get("name") if isinstance(org, dict) else None
+            place = posting.get("jobLocation")
+            if isinstance(place, list):
+                place = place[0] if place else None
+            address = place.get("address") if isinstance(place, dict) else None
+            if not isinstance(address, dict):
+                address = {}
+            location = ", ".join(
+                unescape(address[key]) for key in ("addressLocality", "addressRegion", "addressCountry")
+                if isinstance(address.get(key), str) and address[key]
+            )
+
+            # text fields can be entity-escaped too, like the HTML page
+            return {
+                "title": unescape(title),
+                "company": unescape(company) if isinstance(company, str) else None,
+                "location": location or None,
+                "description": desc_tree.body.text(separator=" ", strip=True) if desc_tree.body else None,
+            }
+
+    return None
+
+
+# ------------------------------
+# Fetch a job card's summary
+# ------------------------------
+
+def fetch_job_summary(url: str):
+    """
+    Fetches the short description for a job card and caches it.
+    Runs in a worker thread so card summaries download concurrently;
+    callers check CACHE before scheduling it.
+    """
+
+    try:
+        job_resp = SESSION.get(url, timeout=10)
+        job_resp.raise_for_status()
+        job_tree = parse_html(job_resp)
+
+        summary_el = extract_description_element(job_tree)
+        summary = summary_el.text(separator=" ", strip=True) if summary_el else None
+
+        CACHE.set(f"summary|{url}", summary, expire=CACHE_TTL)
+        return summary
+    except Exception as e:
+        logging.warning("[fetch_linkedin_jobs] failed summary fetch: %s", e)
+        return None
 
 
 # ------------------------------
@@ -45,98 +471,82 @@ def fetch_linkedin_jobs(keyword: str, location: str, limit: int = 5):
     Scrapes LinkedIn job listings based on search criteria.
     """
 
-    cache_key = f"linkedin|{keyword}|{location}|{limit}"
+    # LinkedIn search ignores case and surrounding whitespace, so the key does too
+    cache_key = f"linkedin|{keyword.strip().casefold()}|{location.strip().casefold()}|{limit}"
 
     # Use cached if fresh
-    cached = JOB_CACHE.get(cache_key)
-    if cached and (time.time() - cached[0] < CACHE_TTL):
-        logging.info(f"[fetch_linkedin_jobs] cache hit: {cache_key}")
-        return cached[1]
+    cached = CACHE.get(cache_key)
+    if cached:
+        logging.info("[fetch_linkedin_jobs] cache hit: %s", cache_key)
+        return cached
+
+    # Concurrent identical searches share one LinkedIn request
+    return single_flight(cache_key, scrape_linkedin_jobs, keyword, location, limit, cache_key)
+
+
+def scrape_linkedin_jobs(keyword: str, location: str, limit: int, cache_key: str):
+    """
+    Fetches and parses a LinkedIn search page, then caches the result.
+    """
 
     # Encode search params
-    q, l = quote_plus(keyword.strip()), quote_plus(location.strip())
+    q, l = quote_query(keyword.strip()), quote_query(location.strip())
     url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={q}&location={l}&start=0"
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "en-CA,en-US;q=0.9",
-    }
-
     try:
-        html = requests.get(url, headers=headers, timeout=15).text
+        resp = SESSION.get(url, timeout=15)
+        html = resp.content
     except Exception as e:
-        logging.error(f"[fetch_linkedin_jobs] fetch error: {e}")
+        logging.error("[fetch_linkedin_jobs] fetch error: %s", e)
         return {"error": str(e), "jobs": []}
 
-    soup = BeautifulSoup(html, "html.parser")
-    cards = soup.select("li") or soup.select("div.base-card")
+    # still failing after retries (e.g. rate limited): report, don't cache
+    if resp.status_code != 200:
+        logging.error("[fetch_linkedin_jobs] LinkedIn HTTP %s", resp.status_code)
+        return {"error": f"LinkedIn HTTP {resp.status_code}", "jobs": []}
 
+    # compressed transfer should show up here as gzip/br
+    logging.debug("[fetch_linkedin_jobs] content-encoding: %s", resp.headers.get("Content-Encoding"))
+
+    # Blocked or empty results: skip the parser entirely
+    if not CARD_MARKER_RE.search(html):
+        # LinkedIn's rate-limit / auth challenge page: report, don't cache
+        if CHALLENGE_MARKER in html[:4096]:
+            logging.warning("[fetch_linkedin_jobs] challenge page, rate limited")
+            return {"error": "LinkedIn rate limited the request", "jobs": []}
+
+        logging.info("[fetch_linkedin_jobs] no job cards in response")
+        return {"error": None, "jobs": []}
+
+    cards = parse_cards(html, html_encoding(resp))
+
+    # Pass 1: card metadata only, stopping at `limit` valid jobs
     jobs = []
 
-    for card in cards:
+    for fields in cards:
         try:
             # Extract job link
-            anchor = (
-                card.select_one("a.base-card__full-link")
-                or card.select_one("a.result-card__full-card-link")
-                or card.select_one("a[href*='/jobs/view/']")
-            )
+            anchor = fields.get("anchor")
 
-            href = anchor.get("href") if anchor else None
+            href = anchor["href"] if anchor else None
             url_abs = (
                 href if (href and href.startswith("http"))
                 else (f"https://www.linkedin.com{href}" if href else None)
             )
 
             # Job title
-            title_el = (
-                card.select_one("h3")
-                or card.select_one(".base-search-card__title")
-                or card.select_one(".job-card-list__title")
-            )
-            title = title_el.get_text(" ", strip=True) if title_el else (
-                anchor.get_text(" ", strip=True) if anchor else None
+            title_el = fields.get("title")
+            title = title_el["text"] if title_el else (
+                anchor["text"] if anchor else None
             )
 
             # Company
-            company_el = (
-                card.select_one("h4")
-                or card.select_one(".base-search-card__subtitle")
-                or card.select_one(".job-card-container__company-name")
-                or card.select_one(".job-card-list__company-name")
-            )
-            company = company_el.get_text(" ", strip=True) if company_el else None
+            company_el = fields.get("company")
+            company = company_el["text"] if company_el else None
 
             # Location
-            loc_el = (
-                card.select_one(".job-search-card__location")
-                or card.select_one(".base-search-card__metadata > .job-search-card__location")
-                or card.select_one(".job-card-container__metadata-item")
-            )
-            loc = loc_el.get_text(" ", strip=True) if loc_el else None
-
-            # Summary (short job description)
-            summary = None
-            if url_abs:
-                cached_sum = SUMMARY_CACHE.get(url_abs)
-                if cached_sum and (time.time() - cached_sum[0] < CACHE_TTL):
-                    summary = cached_sum[1]
-                else:
-                    try:
-                        job_resp = requests.get(url_abs, headers=headers, timeout=10)
-                        job_soup = BeautifulSoup(job_resp.text, "html.parser")
-
-                        summary_el = extract_description_element(job_soup)
-
-                        if summary_el:
-                            summary = summary_el.get_text(" ", strip=True)
-
-                        SUMMARY_CACHE[url_abs] = (time.time(), summary)
-                    except Exception as e:
-                        logging.warning(f"[fetch_linkedin_jobs] failed summary fetch: {e}")
+            loc_el = fields.get("location")
+            loc = loc_el["text"] if loc_el else None
 
             # Only add if title + URL exist
             if title and url_abs:
@@ -145,21 +555,37 @@ def fetch_linkedin_jobs(keyword: str, location: str, limit: int = 5):
                     "company": company,
                     "location": loc,
                     "url": url_abs,
-                    "summary": summary,
+                    "summary": None,
                 })
 
             if len(jobs) >= limit:
                 break
 
         except Exception as e:
-            logging.warning(f"[fetch_linkedin_jobs] parse error: {e}")
+            logging.warning("[fetch_linkedin_jobs] parse error: %s", e)
             continue
 
+    # Pass 2: summaries (short job descriptions) for exactly those jobs,
+    # from cache or fetched concurrently
+    missing = []
+    for job in jobs:
+        cached_sum = CACHE.get(f"summary|{job['url']}", MISSING)
+        if cached_sum is MISSING:
+            missing.append(job)
+        else:
+            job["summary"] = cached_sum
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(len(missing), SUMMARY_WORKERS)) as pool:
+            summaries = pool.map(fetch_job_summary, [job["url"] for job in missing])
+            for job, summary in zip(missing, summaries):
+                job["summary"] = summary
+
     result = {"error": None, "jobs": jobs}
 
     # Cache results
-    JOB_CACHE[cache_key] = (time.time(), result)
-    logging.info(f"[fetch_linkedin_jobs] returning {len(jobs)} jobs")
+    CACHE.set(cache_key, result, expire=CACHE_TTL)
+    logging.info("[fetch_linkedin_jobs] returning %d jobs", len(jobs))
 
     return result
 
@@ -174,44 +600,70 @@ def fetch_job_details(url: str):
     Includes caching.
     """
 
-    cached = DETAIL_CACHE.get(url)
+    # Concurrent requests for the same posting share one fetch
+    return single_flight(f"detail|{url}", scrape_job_details, url)
+
+
+def scrape_job_details(url: str):
+    """
+    Returns the cached job details for a URL, revalidating or
+    re-fetching them once they are older than CACHE_TTL.
+    """
+
+    # (fetched_at, data, etag, last_modified); kept past CACHE_TTL so a
+    # stale copy can be revalidated instead of downloaded again
+    cached = CACHE.get(f"detail|{url}")
+    if not isinstance(cached, tuple):
+        cached = None  # missing, or written by an older version
     if cached and (time.time() - cached[0] < CACHE_TTL):
         return cached[1]
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "en-CA,en-US;q=0.9",
-    }
+    headers = {}
+    if cached:
+        if cached[2]:
+            headers["If-None-Match"] = cached[2]
+        if cached[3]:
+            headers["If-Modified-Since"] = cached[3]
 
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = SESSION.get(url, headers=headers, timeout=15)
+
+        # Unchanged since the cached copy: refresh it without re-parsing
+        if resp.status_code == 304 and cached:
+            CACHE.set(f"detail|{url}", (time.time(), *cached[1:]), expire=VALIDATOR_TTL)
+            return cached[1]
+
         if resp.status_code != 200:
             return {"error": f"LinkedIn HTTP {resp.status_code}"}
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # Structured JSON-LD first; walk the HTML only if it's absent
+        posting = parse_job_posting_ld(resp.content)
+
+        if posting:
+            data = {**posting, "url": url}
+        else:
+            tree = parse_html(resp)
 
-        title = soup.select_one("h1") or soup.select_one(".topcard__title")
-        company = soup.select_one(".topcard__org-name-link") or soup.select_one(".topcard__flavor")
-        location = soup.select_one(".topcard__flavor--bullet") or soup.select_one(".sub-nav-cta__meta-text")
+            title = first_match(tree, DETAIL_TITLE_SELECTORS)
+            company = first_match(tree, DETAIL_COMPANY_SELECTORS)
+            location = first_match(tree, DETAIL_LOCATION_SELECTORS)
 
-        desc_el = extract_description_element(soup)
-        description = desc_el.get_text(" ", strip=True) if desc_el else None
+            desc_el = extract_description_element(tree)
+            description = desc_el.text(separator=" ", strip=True) if desc_el else None
 
-        data = {
-            "title": title.get_text(" ", strip=True) if title else None,
-            "company": company.get_text(" ", strip=True) if company else None,
-            "location": location.get_text(" ", strip=True) if location else None,
-            "url": url,
-            "description": description,
-        }
+            data = {
+                "title": title.text(separator=" ", strip=True) if title else None,
+                "company": company.text(separator=" ", strip=True) if company else None,
+                "location": location.text(separator=" ", strip=True) if location else None,
+                "url": url,
+                "description": description,
+            }
 
-        DETAIL_CACHE[url] = (time.time(), data)
+        entry = (time.time(), data, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+        CACHE.set(f"detail|{url}", entry, expire=VALIDATOR_TTL)
         return data
 
     except Exception as e:
-        logging.error(f"[job_details] fetch error: {e}")
+        logging.error("[job_details] fetch error: %s", e)
         return {"error": str(e)}
 